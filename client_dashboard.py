@@ -1,265 +1,394 @@
-import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import jenkspy
-
-st.set_page_config(layout="wide", page_title="Client Priority Analysis")
-
-st.title("🎯 Client Priority Dashboard")
-st.markdown("Upload your client rankings file and adjust weights to see how priorities shift")
-
-# File uploader
-uploaded_file = st.file_uploader(
-    "Upload Client Rankings (Excel or CSV)", 
-    type=['xlsx', 'xls', 'csv'],
-    help="File should have columns: Client, Current Client, Current Work, Future Work, Difficulty Dealing With, Profitability, Ease to Distribute"
-)
-
-if uploaded_file is None:
-    st.info("👆 Upload your client rankings file to get started")
-    st.stop()
-
-# Read the uploaded file
-try:
-    if uploaded_file.name.endswith('.csv'):
-        df_upload = pd.read_csv(uploaded_file)
-    else:
-        # Read Excel, check if first row contains weights
-        df_temp = pd.read_excel(uploaded_file, nrows=2)
-        
-        # Check if first row looks like it has weights (numeric column names)
-        has_weights_row = any(isinstance(col, (int, float)) for col in df_temp.columns)
-        
-        if has_weights_row:
-            # Skip first row (weights), use second row as header
-            df_upload = pd.read_excel(uploaded_file, header=1)
-        else:
-            df_upload = pd.read_excel(uploaded_file)
-    
-    # Validate columns - handle various column name formats
-    required_cols_map = {
-        'client': 'Client',
-        'current client': 'Current',
-        'current work': 'CW',
-        'future work': 'FW',
-        'difficulty dealing with': 'DD',
-        'profitability': 'Prof',
-        'ease to distribute': 'Ease'
-    }
-    
-    # Create mapping of actual columns to standardized names
-    upload_cols_lower = {col.strip().lower(): col for col in df_upload.columns if isinstance(col, str)}
-    
-    # Check for missing columns
-    missing_cols = []
-    column_mapping = {}
-    for required_lower, standard_name in required_cols_map.items():
-        if required_lower not in upload_cols_lower:
-            missing_cols.append(required_lower)
-        else:
-            column_mapping[upload_cols_lower[required_lower]] = standard_name
-    
-    if missing_cols:
-        st.error(f"Missing required columns: {', '.join(missing_cols)}")
-        st.info("Required columns: Client, Current Client, Current Work, Future Work, Difficulty Dealing With, Profitability, Ease to Distribute")
-        st.info(f"Found columns: {', '.join([str(c) for c in df_upload.columns])}")
-        st.stop()
-    
-    # Rename columns to standard names
-    df_upload = df_upload.rename(columns=column_mapping)
-    
-    # Keep only the columns we need
-    df_upload = df_upload[['Client', 'Current', 'CW', 'FW', 'DD', 'Prof', 'Ease']]
-    
-    st.success(f"✅ Loaded {len(df_upload)} clients")
-    
-except Exception as e:
-    st.error(f"Error reading file: {str(e)}")
-    st.info("Please check that your file has the correct format. See the template file for an example.")
-    st.stop()
-
-st.markdown("---")
-st.markdown("### Adjust Factor Weights")
-
-col1, col2, col3, col4, col5 = st.columns(5)
-
-with col1:
-    cw = st.slider("Current Work", 0, 100, 30, 5, help="Weight for active work")
-with col2:
-    fw = st.slider("Future Work", 0, 100, 25, 5, help="Weight for pipeline/potential")
-with col3:
-    dd = st.slider("Difficulty", 0, 100, 15, 5, help="Weight for ease of working together")
-with col4:
-    prof = st.slider("Profitability", 0, 100, 25, 5, help="Weight for margin/rates")
-with col5:
-    ease = st.slider("Ease Distribute", 0, 100, 5, 5, help="Weight for staffing flexibility")
-
-total = cw + fw + dd + prof + ease
-weights = [cw/total, fw/total, dd/total, prof/total, ease/total]
-
-st.markdown(f"**Normalized Weights:** Current: {weights[0]:.1%} | Future: {weights[1]:.1%} | Difficulty: {weights[2]:.1%} | Profit: {weights[3]:.1%} | Distribute: {weights[4]:.1%}")
-
-df = df_upload.copy()
-df['Score'] = (df['CW'] * weights[0] + df['FW'] * weights[1] + 
-               df['DD'] * weights[2] + df['Prof'] * weights[3] + df['Ease'] * weights[4])
-
-df = df.sort_values('Score', ascending=False).reset_index(drop=True)
-df['Rank'] = range(1, len(df) + 1)
-
-scores = df['Score'].values
-breaks = jenkspy.jenks_breaks(scores, n_classes=4)
-
-# Adjust intermediate breaks upward by 0.075
-breaks[1] += 0.075
-breaks[2] += 0.075
-breaks[3] += 0.075
-
-def assign_tier(score):
-    if score >= breaks[3]:
-        return 'Tier 1: Elite'
-    elif score >= breaks[2]:
-        return 'Tier 2: Priority'
-    elif score >= breaks[1]:
-        return 'Tier 3: Standard'
-    else:
-        return 'Tier 4: Maintenance'
-
-df['Tier'] = df['Score'].apply(assign_tier)
-
-tier_colors = {
-    'Tier 1: Elite': '#1f77b4',
-    'Tier 2: Priority': '#ff7f0e', 
-    'Tier 3: Standard': '#2ca02c',
-    'Tier 4: Maintenance': '#d62728'
-}
-
-st.markdown("---")
-
-st.subheader("Client Rankings with Natural Tier Breaks")
-
-fig = go.Figure()
-
-for tier in ['Tier 1: Elite', 'Tier 2: Priority', 'Tier 3: Standard', 'Tier 4: Maintenance']:
-    tier_df = df[df['Tier'] == tier]
-    fig.add_trace(go.Bar(
-        x=tier_df['Client'],
-        y=tier_df['Score'],
-        name=tier,
-        marker_color=tier_colors[tier],
-        hovertemplate='%{x}<br>Score: %{y:.2f}<extra></extra>'
-    ))
-
-for i in range(1, 4):
-    fig.add_hline(y=breaks[i], line_dash="dash", line_color="gray", 
-                 annotation_text=f"Break: {breaks[i]:.2f}", 
-                 annotation_position="right")
-
-fig.update_layout(
-    height=500,
-    xaxis_title="",
-    yaxis_title="Weighted Score",
-    showlegend=True,
-    barmode='relative',
-    xaxis={'categoryorder': 'total descending'},
-    hovermode='x unified'
-)
-
-st.plotly_chart(fig, use_container_width=True)
-
-st.markdown("---")
-
-col_curve, col_box, col_summary = st.columns(3)
-
-with col_curve:
-    st.subheader("Score Drop-Off Curve")
-    
-    fig_curve = go.Figure()
-    
-    fig_curve.add_trace(go.Scatter(
-        x=df['Rank'],
-        y=df['Score'],
-        mode='lines+markers',
-        marker=dict(size=4, color=df['Tier'].map(tier_colors)),
-        line=dict(color='#1f77b4', width=2),
-        hovertemplate='Rank: %{x}<br>Score: %{y:.2f}<extra></extra>'
-    ))
-    
-    for i in range(1, 4):
-        fig_curve.add_hline(y=breaks[i], line_dash="dash", line_color="lightgray", opacity=0.5)
-    
-    fig_curve.update_layout(
-        height=400,
-        xaxis_title="Client Rank",
-        yaxis_title="Weighted Score",
-        showlegend=False,
-        hovermode='closest'
-    )
-    
-    st.plotly_chart(fig_curve, use_container_width=True)
-    st.caption("📉 Steep drops = natural tier breaks. Gradual slope = no clear priority groups.")
-
-with col_box:
-    st.subheader("Score Distribution by Status")
-    
-    fig_box = go.Figure()
-    
-    current_clients = df[df['Current'] == 'Y']['Score']
-    non_current_clients = df[df['Current'] == 'N']['Score']
-    
-    fig_box.add_trace(go.Box(
-        y=current_clients,
-        name='Current Clients',
-        marker_color='#2ca02c',
-        boxmean='sd'
-    ))
-    
-    fig_box.add_trace(go.Box(
-        y=non_current_clients,
-        name='Non-Current Clients',
-        marker_color='#d62728',
-        boxmean='sd'
-    ))
-    
-    fig_box.update_layout(
-        height=400,
-        yaxis_title="Weighted Score",
-        showlegend=True
-    )
-    
-    st.plotly_chart(fig_box, use_container_width=True)
-    st.caption("📊 Shows if current clients actually score higher than prospects/past clients.")
-
-with col_summary:
-    st.subheader("Tier Summary")
-    
-    tier_summary = df.groupby('Tier').agg({
-        'Client': 'count',
-        'Score': ['min', 'max', 'mean']
-    }).round(2)
-    
-    tier_summary.columns = ['Count', 'Min Score', 'Max Score', 'Avg Score']
-    tier_summary = tier_summary.reindex(['Tier 1: Elite', 'Tier 2: Priority', 'Tier 3: Standard', 'Tier 4: Maintenance'])
-    
-    st.dataframe(tier_summary, use_container_width=True, height=210)
-    
-    st.markdown("### Tier Boundaries")
-    st.markdown(f"**Elite:** ≥ {breaks[3]:.2f}")
-    st.markdown(f"**Priority:** {breaks[2]:.2f} - {breaks[3]:.2f}")
-    st.markdown(f"**Standard:** {breaks[1]:.2f} - {breaks[2]:.2f}")
-    st.markdown(f"**Maintenance:** < {breaks[1]:.2f}")
-
-st.markdown("---")
-st.subheader("Detailed Rankings")
-
-display_df = df[['Rank', 'Client', 'Score', 'Tier', 'Current']].copy()
-display_df['Score'] = display_df['Score'].round(2)
-
-def color_tiers(row):
-    color = tier_colors.get(row['Tier'], '')
-    return [f'background-color: {color}; color: white' if col == 'Tier' else '' for col in row.index]
-
-styled_df = display_df.style.apply(color_tiers, axis=1)
-st.dataframe(styled_df, use_container_width=True, height=400)
-
-st.markdown("---")
-st.caption("💡 **Jenks Natural Breaks**: Algorithm identifies optimal tier boundaries, adjusted +0.075 to align with visual gaps")
\ No newline at end of file
+import io
+
+import numpy as np
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from openpyxl import load_workbook
+
+from natural_breaks import jenks_breaks
+
+st.set_page_config(layout="wide", page_title="Client Priority Analysis")
+
+REQUIRED_COLUMNS_HELP = "Required columns: Client, Current Client, Current Work, Future Work, Difficulty Dealing With, Profitability, Ease to Distribute"
+
+class MissingColumnsError(ValueError):
+    def __init__(self, missing, found):
+        super().__init__(f"Missing required columns: {', '.join(missing)}")
+        self.missing = missing
+        self.found = found
+
+FEATURE_COLUMNS = ['CW', 'FW', 'DD', 'Prof', 'Ease']
+WEBGL_MIN_POINTS = 1000
+TIER_DTYPE = pd.CategoricalDtype(
+    categories=['Tier 1: Elite', 'Tier 2: Priority', 'Tier 3: Standard', 'Tier 4: Maintenance'],
+    ordered=True
+)
+
+def read_xlsx(file_bytes: bytes) -> pd.DataFrame:
+    """Read the active sheet of an .xlsx upload in a single streaming pass.
+
+    If the first row holds the factor weights (any numeric cell), the
+    header is taken from the second row instead.
+    """
+    wb = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        first = next(rows, ())
+        has_weights_row = any(isinstance(cell, (int, float)) for cell in first)
+        header = next(rows, ()) if has_weights_row else first
+        data = [row for row in rows if any(cell is not None for cell in row)]
+    finally:
+        wb.close()
+    return pd.DataFrame(data, columns=list(header))
+
+@st.cache_data(show_spinner=False)
+def load_clients(file_bytes: bytes, name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Parse an uploaded rankings file into per-column arrays.
+
+    Returns the (n, 5) float32 feature matrix, the client names, the raw
+    Current Client flags and a boolean mask of current clients. Cached on
+    the raw upload bytes so slider reruns skip file parsing.
+    """
+    if name.endswith('.csv'):
+        df_upload = pd.read_csv(io.BytesIO(file_bytes))
+    elif name.endswith('.xlsx'):
+        df_upload = read_xlsx(file_bytes)
+    else:
+        # Legacy .xls isn't readable by openpyxl, so probe then re-read with pandas
+        df_temp = pd.read_excel(io.BytesIO(file_bytes), nrows=2)
+        has_weights_row = any(isinstance(col, (int, float)) for col in df_temp.columns)
+        df_upload = pd.read_excel(io.BytesIO(file_bytes), header=1 if has_weights_row else 0)
+    
+    # Validate columns - handle various column name formats
+    required_cols_map = {
+        'client': 'Client',
+        'current client': 'Current',
+        'current work': 'CW',
+        'future work': 'FW',
+        'difficulty dealing with': 'DD',
+        'profitability': 'Prof',
+        'ease to distribute': 'Ease'
+    }
+    
+    # Create mapping of actual columns to standardized names
+    upload_cols_lower = {col.strip().lower(): col for col in df_upload.columns if isinstance(col, str)}
+    
+    # Check for missing columns
+    missing_cols = []
+    column_mapping = {}
+    for required_lower, standard_name in required_cols_map.items():
+        if required_lower not in upload_cols_lower:
+            missing_cols.append(required_lower)
+        else:
+            column_mapping[upload_cols_lower[required_lower]] = standard_name
+    
+    if missing_cols:
+        raise MissingColumnsError(missing_cols, [str(c) for c in df_upload.columns])
+    
+    # Rename columns to standard names
+    df_upload = df_upload.rename(columns=column_mapping)
+    
+    # Scores are small 0-10 ratings, so float32 is plenty and halves the bandwidth
+    for col in FEATURE_COLUMNS:
+        df_upload[col] = pd.to_numeric(df_upload[col], errors='coerce', downcast='float')
+    
+    # Split out only the columns we need
+    feature_matrix = df_upload[FEATURE_COLUMNS].to_numpy(dtype=np.float32)
+    is_current = df_upload['Current'].astype(str).str.strip().str.upper().to_numpy() == 'Y'
+    return feature_matrix, df_upload['Client'].to_numpy(), df_upload['Current'].to_numpy(), is_current
+
+@st.cache_data(show_spinner=False)
+def compute_breaks(scores_key: bytes, n_classes: int = 4) -> list:
+    """Jenks natural breaks for a score vector packed as float32 bytes.
+
+    Keyed on the rounded scores rather than the slider values, so weight
+    tweaks that land on the same scores reuse the previous breaks.
+    """
+    breaks = jenks_breaks(np.frombuffer(scores_key, dtype=np.float32), n_classes=n_classes)
+    # Breaks are data points, so undo the float32 noise on the 3dp values
+    return [round(float(b), 3) for b in breaks]
+
+def move_break_lines(fig: go.Figure, breaks: list) -> None:
+    """Point a figure's three break hlines, and any labels, at new break values."""
+    for shape, value in zip(fig.layout.shapes, breaks[1:4]):
+        shape.update(y0=value, y1=value)
+    for annotation, value in zip(fig.layout.annotations, breaks[1:4]):
+        annotation.update(y=value, text=f"Break: {value:.2f}")
+
+st.title("🎯 Client Priority Dashboard")
+st.markdown("Upload your client rankings file and adjust weights to see how priorities shift")
+
+# File uploader
+uploaded_file = st.file_uploader(
+    "Upload Client Rankings (Excel or CSV)", 
+    type=['xlsx', 'xls', 'csv'],
+    help="File should have columns: Client, Current Client, Current Work, Future Work, Difficulty Dealing With, Profitability, Ease to Distribute"
+)
+
+if uploaded_file is None:
+    st.info("👆 Upload your client rankings file to get started")
+    st.stop()
+
+# Read the uploaded file
+try:
+    feature_matrix, client_names, current_flag, is_current = load_clients(uploaded_file.getvalue(), uploaded_file.name)
+    st.success(f"✅ Loaded {len(client_names)} clients")
+    
+except MissingColumnsError as e:
+    st.error(str(e))
+    st.info(REQUIRED_COLUMNS_HELP)
+    st.info(f"Found columns: {', '.join(e.found)}")
+    st.stop()
+    
+except Exception as e:
+    st.error(f"Error reading file: {str(e)}")
+    st.info("Please check that your file has the correct format. See the template file for an example.")
+    st.stop()
+
+@st.fragment
+def weighting_panel(feature_matrix: np.ndarray, client_names: np.ndarray, current_flag: np.ndarray,
+                    is_current: np.ndarray, file_id: str) -> None:
+    """Weight sliders and everything derived from them.
+
+    Runs as a fragment, so moving a slider reruns only this panel and not
+    the upload and parsing code above it.
+    """
+    st.markdown("---")
+    st.markdown("### Adjust Factor Weights")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        cw = st.slider("Current Work", 0, 100, 30, 5, help="Weight for active work")
+    with col2:
+        fw = st.slider("Future Work", 0, 100, 25, 5, help="Weight for pipeline/potential")
+    with col3:
+        dd = st.slider("Difficulty", 0, 100, 15, 5, help="Weight for ease of working together")
+    with col4:
+        prof = st.slider("Profitability", 0, 100, 25, 5, help="Weight for margin/rates")
+    with col5:
+        ease = st.slider("Ease Distribute", 0, 100, 5, 5, help="Weight for staffing flexibility")
+
+    total = cw + fw + dd + prof + ease
+    weights = [cw/total, fw/total, dd/total, prof/total, ease/total]
+
+    st.markdown(f"**Normalized Weights:** Current: {weights[0]:.1%} | Future: {weights[1]:.1%} | Difficulty: {weights[2]:.1%} | Profit: {weights[3]:.1%} | Distribute: {weights[4]:.1%}")
+
+    scores = feature_matrix @ np.asarray(weights, dtype=np.float32)
+    order = np.argsort(-scores, kind='stable')
+    ranked_key = scores[order].round(3)
+    ascending_key = ranked_key[::-1]
+
+    # Jenks is the expensive step; when the ranking hasn't changed since the last
+    # run, keep the previous tier split and just re-read the break values at it
+    prev_partition = st.session_state.get('jenks_partition')
+    if (prev_partition is not None
+            and prev_partition['file_id'] == file_id
+            and np.array_equal(prev_partition['order'], order)):
+        breaks = [round(float(ascending_key[i]), 3) for i in prev_partition['break_positions']]
+    else:
+        breaks = compute_breaks(ranked_key.tobytes(), n_classes=4)
+        st.session_state['jenks_partition'] = {
+            'file_id': file_id,
+            'order': order,
+            'break_positions': np.searchsorted(ascending_key, np.asarray(breaks, dtype=np.float32))
+        }
+
+    # Adjust intermediate breaks upward by 0.075
+    breaks[1] += 0.075
+    breaks[2] += 0.075
+    breaks[3] += 0.075
+
+    # Tier labels ordered by searchsorted bin index (lowest scores first)
+    tier_labels = np.array(['Tier 4: Maintenance', 'Tier 3: Standard', 'Tier 2: Priority', 'Tier 1: Elite'])
+    bins = np.array([breaks[1], breaks[2], breaks[3]], dtype=np.float32)
+    tier_idx = np.searchsorted(bins, scores, side='right')
+
+    ranks = np.arange(1, len(scores) + 1)
+    ranked_clients = client_names[order]
+    ranked_scores = scores[order]
+    # Tier codes run the other way (0 = Elite), so flip the bin index
+    ranked_tiers = pd.Categorical.from_codes(len(tier_labels) - 1 - tier_idx[order], dtype=TIER_DTYPE)
+    ranked_current = current_flag[order]
+
+    tier_colors = {
+        'Tier 1: Elite': '#1f77b4',
+        'Tier 2: Priority': '#ff7f0e', 
+        'Tier 3: Standard': '#2ca02c',
+        'Tier 4: Maintenance': '#d62728'
+    }
+    tier_palette = np.array([tier_colors[tier] for tier in tier_labels])
+    ranked_colors = tier_palette[tier_idx[order]]
+
+    st.markdown("---")
+
+    st.subheader("Client Rankings with Natural Tier Breaks")
+
+    # Figures are built once per session and only their data is swapped on reruns
+    fig = st.session_state.get('fig_bar')
+    if fig is None:
+        fig = go.Figure()
+        
+        # One bar trace coloured per point; the tier legend comes from empty marker traces
+        fig.add_trace(go.Bar(
+            showlegend=False,
+            hovertemplate='%{x}<br>Score: %{y:.2f}<extra></extra>'
+        ))
+        
+        for tier, color in tier_colors.items():
+            fig.add_trace(go.Scatter(
+                x=[None],
+                y=[None],
+                mode='markers',
+                name=tier,
+                marker=dict(size=10, symbol='square', color=color),
+                hoverinfo='skip'
+            ))
+        
+        for i in range(1, 4):
+            fig.add_hline(y=0, line_dash="dash", line_color="gray", 
+                         annotation_text="", 
+                         annotation_position="right")
+        
+        fig.update_layout(
+            height=500,
+            xaxis_title="",
+            yaxis_title="Weighted Score",
+            showlegend=True,
+            barmode='relative',
+            xaxis={'categoryorder': 'total descending'},
+            hovermode='x unified'
+        )
+        st.session_state['fig_bar'] = fig
+
+    fig.update_traces(selector=dict(type='bar'), x=ranked_clients, y=ranked_scores, marker_color=ranked_colors)
+    move_break_lines(fig, breaks)
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("---")
+
+    col_curve, col_box, col_summary = st.columns(3)
+
+    with col_curve:
+        st.subheader("Score Drop-Off Curve")
+        
+        # WebGL only pays off on large client lists; SVG stays crisper below that
+        use_webgl = len(ranks) >= WEBGL_MIN_POINTS
+        curve_key = 'fig_curve_gl' if use_webgl else 'fig_curve'
+        fig_curve = st.session_state.get(curve_key)
+        if fig_curve is None:
+            fig_curve = go.Figure()
+            
+            curve_trace = go.Scattergl if use_webgl else go.Scatter
+            fig_curve.add_trace(curve_trace(
+                mode='lines+markers',
+                marker=dict(size=4),
+                line=dict(color='#1f77b4', width=2),
+                hovertemplate='Rank: %{x}<br>Score: %{y:.2f}<extra></extra>'
+            ))
+            
+            for i in range(1, 4):
+                fig_curve.add_hline(y=0, line_dash="dash", line_color="lightgray", opacity=0.5)
+            
+            fig_curve.update_layout(
+                height=400,
+                xaxis_title="Client Rank",
+                yaxis_title="Weighted Score",
+                showlegend=False,
+                hovermode='closest'
+            )
+            st.session_state[curve_key] = fig_curve
+        
+        fig_curve.update_traces(x=ranks, y=ranked_scores, marker_color=ranked_colors)
+        move_break_lines(fig_curve, breaks)
+        
+        st.plotly_chart(fig_curve, use_container_width=True)
+        st.caption("📉 Steep drops = natural tier breaks. Gradual slope = no clear priority groups.")
+
+    with col_box:
+        st.subheader("Score Distribution by Status")
+        
+        fig_box = st.session_state.get('fig_box')
+        if fig_box is None:
+            fig_box = go.Figure()
+            
+            fig_box.add_trace(go.Box(
+                name='Current Clients',
+                marker_color='#2ca02c',
+                boxmean='sd'
+            ))
+            
+            fig_box.add_trace(go.Box(
+                name='Non-Current Clients',
+                marker_color='#d62728',
+                boxmean='sd'
+            ))
+            
+            fig_box.update_layout(
+                height=400,
+                yaxis_title="Weighted Score",
+                showlegend=True
+            )
+            st.session_state['fig_box'] = fig_box
+        
+        fig_box.update_traces(selector=dict(name='Current Clients'), y=scores[is_current])
+        fig_box.update_traces(selector=dict(name='Non-Current Clients'), y=scores[~is_current])
+        
+        st.plotly_chart(fig_box, use_container_width=True)
+        st.caption("📊 Shows if current clients actually score higher than prospects/past clients.")
+
+    with col_summary:
+        st.subheader("Tier Summary")
+        
+        # Bin index 3 is Tier 1, so flip the per-bin stats into display order
+        counts = np.bincount(tier_idx, minlength=4)[::-1]
+        sums = np.bincount(tier_idx, weights=scores, minlength=4)[::-1]
+        
+        # Ranked scores are already grouped by tier, highest first, so each
+        # tier's max and min sit at the start and end of its run
+        starts = np.cumsum(counts) - counts
+        has_clients = counts > 0
+        min_scores = np.full(4, np.nan)
+        max_scores = np.full(4, np.nan)
+        min_scores[has_clients] = ranked_scores[(starts + counts - 1)[has_clients]]
+        max_scores[has_clients] = ranked_scores[starts[has_clients]]
+        
+        with np.errstate(invalid='ignore'):
+            avg_scores = sums / counts
+        
+        tier_summary = pd.DataFrame({
+            'Count': counts,
+            'Min Score': min_scores,
+            'Max Score': max_scores,
+            'Avg Score': avg_scores
+        }, index=pd.CategoricalIndex(TIER_DTYPE.categories, dtype=TIER_DTYPE, name='Tier')).round(2)
+        
+        st.dataframe(tier_summary, use_container_width=True, height=210)
+        
+        st.markdown("### Tier Boundaries")
+        st.markdown(f"**Elite:** ≥ {breaks[3]:.2f}")
+        st.markdown(f"**Priority:** {breaks[2]:.2f} - {breaks[3]:.2f}")
+        st.markdown(f"**Standard:** {breaks[1]:.2f} - {breaks[2]:.2f}")
+        st.markdown(f"**Maintenance:** < {breaks[1]:.2f}")
+
+    st.markdown("---")
+    st.subheader("Detailed Rankings")
+
+    display_df = pd.DataFrame({
+        'Rank': ranks,
+        'Client': ranked_clients,
+        'Score': ranked_scores.round(2),
+        'Tier': ranked_tiers,
+        'Current': ranked_current
+    })
+
+    tier_css = {tier: f'background-color: {color}; color: white' for tier, color in tier_colors.items()}
+    styled_df = display_df.style.map(lambda tier: tier_css.get(tier, ''), subset=['Tier'])
+    st.dataframe(styled_df, use_container_width=True, height=400)
+
+    st.markdown("---")
+    st.caption("💡 **Jenks Natural Breaks**: Algorithm identifies optimal tier boundaries, adjusted +0.075 to align with visual gaps")
+
+weighting_panel(feature_matrix, client_names, current_flag, is_current, uploaded_file.file_id)
@@ -0,0 +1,74 @@
+"""Jenks natural breaks, with an optional numba kernel for large inputs.
+
+jenkspy handles typical client lists. When numba is installed, lists of
+NUMBA_MIN_POINTS or more use a compiled Fisher-Jenks kernel instead,
+which gives the same breaks as jenkspy.
+"""
+import numpy as np
+import jenkspy
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+NUMBA_MIN_POINTS = 5000
+
+if njit is not None:
+    @njit("f8[:](f8[:], i8)", parallel=True, cache=True)
+    def jenks_breaks_numba(y, k):
+        """Fisher-Jenks breaks of ascending-sorted y, in jenkspy's layout.
+
+        Fills the cost matrix one class column at a time; column j only
+        reads column j - 1, so the rows of a column are filled in parallel,
+        each thread writing only its own row.
+        """
+        n = y.shape[0]
+        lower_class_limits = np.ones((n + 1, k + 1), dtype=np.int64)
+        variance_combinations = np.full((n + 1, k + 1), np.inf)
+        variance_combinations[1, :] = 0.0
+
+        # A single class covering y[0:l]
+        s1 = 0.0
+        s2 = 0.0
+        for l in range(1, n + 1):
+            s1 += y[l - 1]
+            s2 += y[l - 1] * y[l - 1]
+            variance_combinations[l, 1] = s2 - s1 * s1 / l
+
+        for j in range(2, k + 1):
+            for l in prange(2, n + 1):
+                s1 = 0.0
+                s2 = 0.0
+                best = np.inf
+                best_lower = 1
+                for m in range(1, l + 1):
+                    lower = l - m + 1
+                    val = y[lower - 1]
+                    s1 += val
+                    s2 += val * val
+                    if lower > 1:
+                        cost = s2 - s1 * s1 / m + variance_combinations[lower - 1, j - 1]
+                        if best >= cost:
+                            best = cost
+                            best_lower = lower
+                variance_combinations[l, j] = best
+                lower_class_limits[l, j] = best_lower
+
+        breaks = np.zeros(k + 1)
+        breaks[0] = y[0]
+        breaks[k] = y[n - 1]
+        row = n
+        for count in range(k, 1, -1):
+            breaks[count - 1] = y[lower_class_limits[row, count] - 2]
+            row = lower_class_limits[row, count] - 1
+        return breaks
+else:
+    jenks_breaks_numba = None
+
+def jenks_breaks(values, n_classes: int) -> list:
+    """Jenks natural breaks of values: [min, upper bounds..., max]."""
+    if jenks_breaks_numba is not None and len(values) >= NUMBA_MIN_POINTS:
+        y = np.sort(np.asarray(values, dtype=np.float64))
+        return jenks_breaks_numba(y, n_classes).tolist()
+    return jenkspy.jenks_breaks(values, n_classes=n_classes)